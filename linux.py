@@ -1,12 +1,20 @@
 import streamlit as st
+import bisect
 import subprocess
 import os
+import pickle
+import re
 import glob
 import shlex
+import shutil
+import signal
+import tempfile
 import time
 from pathlib import Path
 import threading
 import queue
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Page configuration
 st.set_page_config(
@@ -16,8 +24,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for terminal-like appearance
-st.markdown("""
+@st.cache_resource
+def _css():
+    """Custom CSS for terminal-like appearance"""
+    return """
 <style>
     .main > div {
         padding-top: 2rem;
@@ -28,13 +38,10 @@ st.markdown("""
         color: #58a6ff;
         border: 1px solid #30363d;
     }
-    .command-output {
+    [data-testid="stCode"] pre {
         background-color: #0d1117;
         color: #c9d1d9;
-        padding: 10px;
-        border-radius: 5px;
         font-family: 'Courier New', monospace;
-        white-space: pre-wrap;
         border: 1px solid #30363d;
         max-height: 400px;
         overflow-y: auto;
@@ -49,123 +56,648 @@ st.markdown("""
         border: 1px solid #30363d;
         border-bottom: none;
     }
-    .error-output {
-        background-color: #1a1e23;
-        color: #f85149;
-        padding: 10px;
-        border-radius: 5px;
-        font-family: 'Courier New', monospace;
-        white-space: pre-wrap;
-        border: 1px solid #da3633;
-        margin-top: 5px;
-    }
-    .success-output {
-        background-color: #0d1421;
-        color: #56d364;
-        padding: 10px;
-        border-radius: 5px;
-        font-family: 'Courier New', monospace;
-        white-space: pre-wrap;
-        border: 1px solid #238636;
-        margin-top: 5px;
-    }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def get_bin_commands():
-    """Get all executable commands from common bin directories"""
-    bin_paths = ['/bin', '/usr/bin', '/usr/local/bin', '/sbin', '/usr/sbin']
+st.markdown(_css(), unsafe_allow_html=True)
+
+def _scan_bin_dir(bin_path):
+    """Return the names of executable files in a single directory"""
     commands = set()
-    
-    for bin_path in bin_paths:
-        if os.path.exists(bin_path):
+    # os.scandir rather than Path.iterdir: Path.iterdir yields Paths without
+    # cached stat data, so each is_file() would cost an extra stat().
+    # A directory removed since _unique_dirs stat'ed it is simply skipped
+    try:
+        with os.scandir(bin_path) as entries:
+            for entry in entries:
+                if entry.is_file() and os.access(entry.path, os.X_OK):
+                    commands.add(entry.name)
+    except OSError:
+        pass
+    return commands
+
+def _unique_dirs(paths):
+    """Drop missing paths and paths that resolve to an already-seen directory
+
+    On merged-/usr systems /bin and /sbin are symlinks into /usr, so
+    deduplicating by (st_dev, st_ino) avoids scanning them twice. Returns
+    (path, stat_result) pairs so callers can reuse the stat data.
+    """
+    seen = set()
+    unique = []
+    for path in paths:
+        try:
+            st_result = os.stat(path)
+        except OSError:
+            continue
+        key = (st_result.st_dev, st_result.st_ino)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append((path, st_result))
+    return unique
+
+COMMAND_CACHE_PATH = Path.home() / '.cache' / 'linux_explorer' / 'commands.pkl'
+
+def _load_command_cache(max_mtime):
+    """Return the pickled command list if it is newer than max_mtime"""
+    try:
+        if COMMAND_CACHE_PATH.stat().st_mtime < max_mtime:
+            return None
+        with COMMAND_CACHE_PATH.open('rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+def _save_command_cache(commands):
+    """Persist the command list so a server restart can skip the scan
+
+    Writes to a temporary file and renames it into place so concurrent
+    sessions never read a partially written pickle.
+    """
+    tmp_path = None
+    try:
+        COMMAND_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=COMMAND_CACHE_PATH.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(commands, f)
+        os.replace(tmp_path, COMMAND_CACHE_PATH)
+    except OSError:
+        if tmp_path:
             try:
-                for item in os.listdir(bin_path):
-                    full_path = os.path.join(bin_path, item)
-                    if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
-                        commands.add(item)
-            except PermissionError:
-                continue
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+def _clear_command_cache():
+    """Remove the persisted command list, ignoring filesystem errors"""
+    try:
+        COMMAND_CACHE_PATH.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+def _scan_commands(bin_dirs):
+    """Return the sorted executable names found in (path, stat_result) pairs"""
+    persisted = _load_command_cache(max(st_result.st_mtime for _, st_result in bin_dirs))
+    if persisted is not None:
+        return persisted
+    
+    bin_paths = [path for path, _ in bin_dirs]
+    # Scan directories concurrently; scandir releases the GIL during syscalls
+    with ThreadPoolExecutor(max_workers=len(bin_paths)) as executor:
+        results = executor.map(_scan_bin_dir, bin_paths)
+        commands = set().union(*results)
     
-    return sorted(list(commands))
+    commands = sorted(list(commands))
+    _save_command_cache(commands)
+    return commands
+
+def _prefix_index(cmds):
+    """Build a (sorted lowercase keys, commands) index for prefix lookups"""
+    pairs = sorted((cmd.lower(), cmd) for cmd in cmds)
+    return tuple(key for key, _ in pairs), tuple(cmd for _, cmd in pairs)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_bin_commands():
+    """Get all executable commands from common bin directories
+
+    Returns (commands, lowercased commands, prefix index) so the search
+    structures are built once per scan rather than on every rerun.
+    """
+    bin_dirs = _unique_dirs(['/bin', '/usr/bin', '/usr/local/bin', '/sbin', '/usr/sbin'])
+    commands = _scan_commands(bin_dirs) if bin_dirs else []
+    commands_lc = tuple(cmd.lower() for cmd in commands)
+    return commands, commands_lc, _prefix_index(commands)
+
+def prefix_search(index, needle):
+    """Return commands whose lowercase name starts with needle"""
+    keys, cmds = index
+    lo = bisect.bisect_left(keys, needle)
+    hi = bisect.bisect_left(keys, needle + '\uffff', lo)
+    return list(cmds[lo:hi])
+
+def get_command_path(command):
+    """Resolve a command's full path on PATH"""
+    return shutil.which(command)
 
 def get_command_help(command):
     """Get help information for a command"""
-    help_options = ['--help', '-h', 'help']
-    
-    for help_opt in help_options:
+    # Many tools print --help to stderr or exit nonzero, so accept any output
+    for argv in ([command, '--help'], ['man', '-P', 'cat', command]):
         try:
-            if help_opt == 'help':
-                cmd = f"help {command}"
-            else:
-                cmd = f"{command} {help_opt}"
-            
             result = subprocess.run(
-                cmd, 
-                shell=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=5
+                argv,
+                capture_output=True,
+                text=True,
+                errors='replace',
+                timeout=2
             )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout
-            elif result.stderr.strip():
-                return result.stderr
-                
-        except (subprocess.TimeoutExpired, Exception):
+        except (subprocess.TimeoutExpired, OSError):
             continue
+        
+        help_text = result.stdout if result.stdout.strip() else result.stderr
+        if help_text.strip():
+            return help_text
     
     return "No help information available"
 
+# Commands blocked from execution
+DANGEROUS_COMMANDS = frozenset({
+    'rm', 'rmdir', 'del', 'format', 'fdisk', 'mkfs',
+    'dd', 'shred', 'wipe', 'halt', 'shutdown', 'reboot',
+    'init', 'kill', 'killall', 'pkill', 'fuser'
+})
+
+# One compiled pattern over the whole set, matched against a single argv
+# word: any directory prefix (/bin/rm) and dotted suffix (mkfs.ext4) allowed
+DANGEROUS_COMMAND_RE = re.compile(
+    r'(?:.*/)?(?:' + '|'.join(sorted(map(re.escape, DANGEROUS_COMMANDS))) + r')(?:\.[^/]*)?'
+)
+
+# Commands that run another command given later on their argv, mapped to
+# (options that take a separate value, operands before the wrapped command)
+WRAPPER_COMMANDS = {
+    'sudo': ({'-u', '-g', '-C', '-D', '-h', '-p', '-r', '-t', '-T', '-U',
+              '--user', '--group', '--close-from', '--chdir', '--host',
+              '--prompt', '--role', '--type', '--command-timeout',
+              '--other-user'}, 0),
+    'doas': ({'-u', '-C'}, 0),
+    # env -S/--split-string values are commands themselves, see _wrapped_argv
+    'env': ({'-u', '-C', '-S', '--unset', '--chdir', '--split-string'}, 0),
+    'xargs': ({'-a', '-d', '-E', '-I', '-L', '-n', '-P', '-s', '--arg-file',
+               '--delimiter', '--max-args', '--max-procs', '--max-chars',
+               '--max-lines', '--process-slot-var'}, 0),
+    'nohup': (set(), 0),
+    'nice': ({'-n', '--adjustment'}, 0),
+    'ionice': ({'-c', '-n', '--class', '--classdata'}, 0),
+    'timeout': ({'-s', '-k', '--signal', '--kill-after'}, 1),
+    'stdbuf': ({'-i', '-o', '-e', '--input', '--output', '--error'}, 0),
+    'setsid': (set(), 0),
+    'chroot': ({'--userspec', '--groups'}, 1),
+    'time': ({'-f', '-o', '--format', '--output'}, 0),
+    'busybox': (set(), 0),
+}
+
+SHELL_COMMANDS = frozenset({'sh', 'bash', 'dash', 'zsh', 'ksh'})
+FIND_EXEC_ACTIONS = frozenset({'-exec', '-execdir', '-ok', '-okdir'})
+
+def _command_name(word):
+    """Normalize an argv word to a bare command name: /sbin/mkfs.ext4 -> mkfs"""
+    return os.path.basename(word).split('.', 1)[0]
+
+# Wrapper options whose value is itself a command line to split and check
+SPLIT_STRING_OPTIONS = {'env': {'-S', '--split-string'}}
+
+def _wrapped_argv(name, argv):
+    """Return the argv that wrapper command argv[0] will run
+
+    Skips the wrapper's own options, their values and any leading operands.
+    Raises ValueError if a split-string option value cannot be parsed.
+    """
+    value_options, operands = WRAPPER_COMMANDS[name]
+    split_options = SPLIT_STRING_OPTIONS.get(name, set())
+    i = 1
+    while i < len(argv):
+        word = argv[i]
+        i += 1
+        if word == '--':
+            break
+        
+        option = value = None
+        if word.startswith('--'):
+            option, has_value, value = word.partition('=')
+            if option not in value_options:
+                continue
+            if not has_value:
+                value = argv[i] if i < len(argv) else ''
+                i += 1
+        elif word.startswith('-') and len(word) > 1:
+            # Short options may be clustered (-iu root) or attached (-uroot)
+            for j, flag in enumerate(word[1:], 2):
+                if '-' + flag in value_options:
+                    option, value = '-' + flag, word[j:]
+                    if not value:
+                        value = argv[i] if i < len(argv) else ''
+                        i += 1
+                    break
+            if option is None:
+                continue
+        elif name == 'env' and '=' in word:
+            continue
+        else:
+            i -= 1
+            break
+        
+        if option in split_options:
+            return shlex.split(value) + argv[i:]
+    
+    return argv[i + operands:]
+
+# Shell words that may precede the command word of a simple command
+SHELL_PREFIX_WORDS = frozenset({
+    '{', '}', '!', 'if', 'then', 'else', 'elif', 'fi', 'do', 'done',
+    'while', 'until', 'exec', 'command', 'builtin', 'time'
+})
+
+def _script_command(segment):
+    """Strip assignments, reserved words and builtins in front of a command"""
+    i = 0
+    while i < len(segment):
+        word = segment[i]
+        if word in SHELL_PREFIX_WORDS:
+            i += 1
+            # exec/command/time options come before the command (exec -a NAME)
+            while i < len(segment) and segment[i].startswith('-'):
+                i += 2 if word == 'exec' and segment[i] == '-a' else 1
+        elif '=' in word and word.partition('=')[0].isidentifier():
+            i += 1
+        else:
+            break
+    return segment[i:]
+
+def _is_blocked_script(script):
+    """Check each command in a shell -c script string"""
+    # Newlines and backticks separate commands just like ;
+    script = script.replace('\n', ';').replace('`', ';')
+    lexer = shlex.shlex(script, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        return True
+    
+    segment = []
+    for token in tokens + [';']:
+        if not all(c in '();<>|&' for c in token):
+            segment.append(token)
+            continue
+        argv = _script_command(segment)
+        segment = []
+        if not argv:
+            continue
+        if argv[0] == 'eval':
+            if _is_blocked_script(' '.join(argv[1:])):
+                return True
+        # A command word built from expansions cannot be checked statically
+        elif any(c in argv[0] for c in '$*?[~') or is_blocked_argv(argv):
+            return True
+    return False
+
+def is_blocked_argv(argv):
+    """Return True if argv, or any command it wraps or scripts, is dangerous"""
+    if not argv:
+        return False
+    
+    if DANGEROUS_COMMAND_RE.fullmatch(argv[0]):
+        return True
+    
+    name = _command_name(argv[0])
+    
+    if name in WRAPPER_COMMANDS:
+        try:
+            return is_blocked_argv(_wrapped_argv(name, argv))
+        except ValueError:
+            return True
+    
+    if name == 'find':
+        return any(word in FIND_EXEC_ACTIONS and is_blocked_argv(argv[i + 1:])
+                   for i, word in enumerate(argv))
+    
+    if name in SHELL_COMMANDS:
+        for i, word in enumerate(argv[1:-1], 1):
+            if word.startswith('-') and not word.startswith('--') and 'c' in word:
+                return _is_blocked_script(argv[i + 1])
+    
+    return False
+
+# Default flags applied when a command is run without arguments
+SAFE_COMMANDS = {
+    'ls': 'ls -la',
+    'ps': 'ps aux',
+    'df': 'df -h',
+    'du': 'du -h --max-depth=1',
+    'free': 'free -h',
+    'top': 'top -b -n1',
+    'netstat': 'netstat -tuln',
+    'ss': 'ss -tuln'
+}
+
+def _build_argv(command):
+    """Split a command into argv, applying safety checks and default flags
+
+    Returns (argv, error); argv is None when the command is rejected.
+    """
+    try:
+        argv = shlex.split(command)
+    except ValueError as e:
+        return None, f"Error: {str(e)}"
+    if not argv:
+        return None, "No command given"
+    
+    base_cmd = argv[0]
+    # Sanitize command to prevent dangerous operations
+    if is_blocked_argv(argv):
+        return None, "Command blocked for safety reasons"
+    
+    # Add safe flags for some commands
+    if base_cmd in SAFE_COMMANDS and len(argv) == 1:
+        argv = shlex.split(SAFE_COMMANDS[base_cmd])
+    
+    return argv, None
+
 def run_command_safe(command, timeout=10):
-    """Safely run a command with timeout and error handling"""
+    """Safely run a command with timeout and error handling
+
+    Commands are split with shlex and executed without a shell.
+    """
+    argv, error = _build_argv(command)
+    if error:
+        return False, "", error
+    
     try:
-        # Sanitize command to prevent dangerous operations
-        dangerous_commands = [
-            'rm', 'rmdir', 'del', 'format', 'fdisk', 'mkfs', 
-            'dd', 'shred', 'wipe', 'halt', 'shutdown', 'reboot',
-            'init', 'kill', 'killall', 'pkill', 'fuser'
-        ]
+        result = subprocess.run(
+            argv,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
         
-        base_cmd = command.split()[0]
-        if base_cmd in dangerous_commands:
-            return False, "Command blocked for safety reasons", ""
+        return True, result.stdout, result.stderr
         
-        # Add safe flags for some commands
-        safe_commands = {
-            'ls': 'ls -la',
-            'ps': 'ps aux',
-            'df': 'df -h',
-            'du': 'du -h --max-depth=1',
-            'free': 'free -h',
-            'top': 'top -b -n1',
-            'netstat': 'netstat -tuln',
-            'ss': 'ss -tuln'
-        }
+    except subprocess.TimeoutExpired:
+        return False, "", "Command timed out"
+    except Exception as e:
+        return False, "", f"Error: {str(e)}"
+
+STREAM_TAIL_LINES = 500
+STREAM_REDRAW_INTERVAL = 0.1
+
+def stream_command_safe(command, on_output, timeout=10):
+    """Run a command, passing the tail of its stdout to on_output as it arrives
+
+    A worker thread feeds stdout lines through a bounded queue so the
+    timeout is enforced even while the command is silent. The command runs
+    in its own session so a timeout kills any background children holding
+    the pipes too. Only the last STREAM_TAIL_LINES lines are kept, and
+    redraws are throttled to one per STREAM_REDRAW_INTERVAL seconds. The
+    returned stdout is that same tail.
+    """
+    argv, error = _build_argv(command)
+    if error:
+        return False, "", error
+    
+    try:
+        proc = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace',
+            bufsize=1,
+            start_new_session=True
+        )
+    except Exception as e:
+        return False, "", f"Error: {str(e)}"
+    
+    # Bounded so a fast producer blocks instead of filling memory
+    lines = queue.Queue(maxsize=STREAM_TAIL_LINES)
+    stop = threading.Event()
+    stderr_chunks = []
+    
+    def _pump_stdout():
+        try:
+            for line in proc.stdout:
+                # Give up once the consumer has stopped reading
+                while not stop.is_set():
+                    try:
+                        lines.put(line, timeout=STREAM_REDRAW_INTERVAL)
+                        break
+                    except queue.Full:
+                        pass
+                if stop.is_set():
+                    return
+        except Exception as e:
+            stderr_chunks.append(f"Error: {str(e)}\n")
+        finally:
+            # Always signal end of output so the consumer never waits on a dead thread
+            try:
+                lines.put_nowait(None)
+            except queue.Full:
+                pass
+    
+    threading.Thread(target=_pump_stdout, daemon=True).start()
+    stderr_thread = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()),
+        daemon=True
+    )
+    stderr_thread.start()
+    
+    tail = deque(maxlen=STREAM_TAIL_LINES)
+    line_count = 0
+    
+    def _tail_text():
+        text = "".join(tail)
+        if line_count > len(tail):
+            text = f"... ({line_count - len(tail)} earlier lines not shown)\n" + text
+        return text
+    
+    def _kill_group():
+        stop.set()
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            proc.kill()
+        proc.wait()
+    
+    deadline = time.monotonic() + timeout
+    last_draw = 0.0
+    dirty = False
+    finished = False
+    while not finished:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            _kill_group()
+            if dirty:
+                on_output(_tail_text())
+            return False, _tail_text(), "Command timed out"
+        
+        try:
+            line = lines.get(timeout=min(remaining, STREAM_REDRAW_INTERVAL) if dirty else remaining)
+        except queue.Empty:
+            line = ""
         
-        if base_cmd in safe_commands and command == base_cmd:
-            command = safe_commands[base_cmd]
+        if line is None:
+            finished = True
+        elif line:
+            tail.append(line)
+            line_count += 1
+            dirty = True
         
+        now = time.monotonic()
+        if dirty and (finished or now - last_draw >= STREAM_REDRAW_INTERVAL):
+            on_output(_tail_text())
+            last_draw = now
+            dirty = False
+    
+    try:
+        proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        _kill_group()
+        return False, _tail_text(), "Command timed out"
+    
+    # A background child may still hold stderr open; never wait past the deadline
+    stderr_thread.join(timeout=max(deadline - time.monotonic(), 0))
+    if stderr_thread.is_alive():
+        _kill_group()
+        return False, _tail_text(), "Command timed out"
+    return True, _tail_text(), "".join(stderr_chunks)
+
+def run_argv(argv, timeout=10):
+    """Run a fixed, trusted argv list without a shell or safety checks"""
+    try:
         result = subprocess.run(
-            command,
-            shell=True,
+            argv,
             capture_output=True,
             text=True,
             timeout=timeout
         )
-        
         return True, result.stdout, result.stderr
-        
     except subprocess.TimeoutExpired:
         return False, "", "Command timed out"
     except Exception as e:
         return False, "", f"Error: {str(e)}"
 
+def run_pipeline(first_argv, second_argv, timeout=10):
+    """Run the equivalent of `first | second` without a shell"""
+    try:
+        first = subprocess.Popen(first_argv, stdout=subprocess.PIPE)
+    except Exception as e:
+        return False, "", f"Error: {str(e)}"
+    
+    try:
+        try:
+            second = subprocess.Popen(
+                second_argv,
+                stdin=first.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors='replace'
+            )
+        finally:
+            # Let the first process receive SIGPIPE if the second exits early
+            first.stdout.close()
+        try:
+            stdout, stderr = second.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            second.kill()
+            second.communicate()
+            return False, "", "Command timed out"
+        return True, stdout, stderr
+    except Exception as e:
+        return False, "", f"Error: {str(e)}"
+    finally:
+        # Never leave the first process running, whatever happened to the second
+        if first.poll() is None:
+            first.kill()
+        first.wait()
+
+BATCH_SEPARATOR = '---SEP---'
+
+def run_commands_batch(commands, timeout=15):
+    """Run several fixed commands in a single shell and split their output"""
+    script = f"; echo '{BATCH_SEPARATOR}'; ".join(commands)
+    try:
+        result = subprocess.run(
+            script,
+            shell=True,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        outputs = [out.strip('\n') for out in result.stdout.split(f"{BATCH_SEPARATOR}\n")]
+        return True, outputs, result.stderr
+    except subprocess.TimeoutExpired:
+        return False, [], "Command timed out"
+    except Exception as e:
+        return False, [], f"Error: {str(e)}"
+
+LRU_LIMIT = 128
+
+def _lru_put(key, value):
+    """Store a value in the per-session LRU, evicting the oldest entries"""
+    lru = st.session_state._lru
+    lru[key] = (time.monotonic(), value)
+    lru.move_to_end(key)
+    while len(lru) > LRU_LIMIT:
+        lru.popitem(last=False)
+
+def cached(key, fn, ttl=None):
+    """Return fn() memoized under key in the bounded per-session LRU
+
+    Shared by path, help and command-result lookups so a long-running
+    session holds at most LRU_LIMIT results. Entries older than ttl
+    seconds are recomputed.
+    """
+    lru = st.session_state._lru
+    if key in lru:
+        stored_at, value = lru[key]
+        if ttl is None or time.monotonic() - stored_at < ttl:
+            lru.move_to_end(key)
+            return value
+    value = fn()
+    _lru_put(key, value)
+    return value
+
+def _prefetch_help_worker(command, results):
+    """Fetch help for a command in the background and post it to a queue
+
+    A result is always posted, even on failure, so the command is cleared
+    from help_pending and can be fetched again.
+    """
+    help_text = "No help information available"
+    try:
+        help_text = get_command_help(command)
+    except Exception as e:
+        help_text = f"Error: {str(e)}"
+    finally:
+        results.put((command, help_text))
+
+def _drain_help_prefetch():
+    """Move finished prefetch results into the per-session LRU"""
+    while True:
+        try:
+            command, help_text = st.session_state.help_queue.get_nowait()
+        except queue.Empty:
+            break
+        st.session_state.help_pending.discard(command)
+        _lru_put(('help', command), help_text)
+
+def prefetch_help(command):
+    """Start fetching help for a command unless it is cached, in flight or blocked"""
+    _drain_help_prefetch()
+    if ('help', command) in st.session_state._lru or command in st.session_state.help_pending:
+        return
+    # Never run blocked commands unprompted, not even with --help
+    if is_blocked_argv([command]):
+        return
+    st.session_state.help_pending.add(command)
+    threading.Thread(
+        target=_prefetch_help_worker,
+        args=(command, st.session_state.help_queue),
+        daemon=True
+    ).start()
+
+def get_prefetched_help(command):
+    """Return prefetched help if available, otherwise fetch it synchronously"""
+    _drain_help_prefetch()
+    return cached(('help', command), lambda: get_command_help(command))
+
 # Initialize session state
-if 'commands' not in st.session_state:
-    st.session_state.commands = []
-    st.session_state.loading = True
+if '_lru' not in st.session_state:
+    st.session_state._lru = OrderedDict()
+    st.session_state.help_queue = queue.Queue()
+    st.session_state.help_pending = set()
 
 # Header
 st.title("🐧 Linux Command Explorer")
@@ -175,13 +707,15 @@ st.markdown("**Explore and execute Linux commands from /bin directories**")
 with st.sidebar:
     st.header("⚙️ Controls")
     
-    # Load commands button
+    # Load commands button; the cleared cache is refilled further down this same run
     if st.button("🔄 Refresh Commands", type="primary"):
-        st.session_state.loading = True
-        st.rerun()
+        get_bin_commands.clear()
+        _clear_command_cache()
     
     # Search functionality
     search_term = st.text_input("🔍 Search Commands", placeholder="Type command name...")
+    substring_search = st.checkbox("Substring search", value=False,
+                                   help="Match anywhere in the name instead of only at the start")
     
     # Filter options
     st.subheader("Filters")
@@ -192,19 +726,27 @@ with st.sidebar:
     st.subheader("Safety")
     safe_mode = st.checkbox("Safe mode (recommended)", value=True, 
                            help="Prevents execution of potentially dangerous commands")
+    
+    # Result caching
+    st.subheader("Caching")
+    cache_results = st.checkbox("Cache command results", value=False,
+                                help="Reuse output of identical commands for 60 seconds")
+    if st.button("🧹 Clear Cache"):
+        st.session_state._lru.clear()
 
-# Load commands
-if st.session_state.loading:
-    with st.spinner("Loading commands from /bin directories..."):
-        st.session_state.commands = get_bin_commands()
-        st.session_state.loading = False
-        st.rerun()
+# Load commands (cached across reruns)
+with st.spinner("Loading commands from /bin directories..."):
+    commands, commands_lc, prefix_index = get_bin_commands()
 
 # Filter commands based on search
-filtered_commands = st.session_state.commands
+filtered_commands = commands
 if search_term:
-    filtered_commands = [cmd for cmd in st.session_state.commands 
-                        if search_term.lower() in cmd.lower()]
+    needle = search_term.lower()
+    if substring_search:
+        filtered_commands = [cmd for cmd, cmd_lc in zip(commands, commands_lc)
+                            if needle in cmd_lc]
+    else:
+        filtered_commands = prefix_search(prefix_index, needle)
 
 # Main content
 col1, col2 = st.columns([1, 2])
@@ -223,19 +765,13 @@ with col1:
         # Command information
         if selected_command:
             st.markdown(f"**Selected:** `{selected_command}`")
+            prefetch_help(selected_command)
             
             # Get command path
-            try:
-                which_result = subprocess.run(
-                    f"which {selected_command}",
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                if which_result.returncode == 0:
-                    st.markdown(f"**Path:** `{which_result.stdout.strip()}`")
-            except:
-                pass
+            command_path = cached(('which', selected_command),
+                                  lambda: get_command_path(selected_command))
+            if command_path:
+                st.markdown(f"**Path:** `{command_path}`")
     else:
         st.warning("No commands found matching your search.")
 
@@ -263,18 +799,29 @@ with col2:
         # Execute button
         if st.button(f"▶️ Execute: {full_command}", type="primary"):
             with st.spinner("Executing command..."):
-                success, stdout, stderr = run_command_safe(full_command)
+                output_placeholder = st.empty()
                 
-                if success:
-                    if stdout:
+                def show_output(text):
+                    with output_placeholder.container():
                         st.markdown('<div class="command-header">✅ Output:</div>', unsafe_allow_html=True)
-                        st.markdown(f'<div class="command-output">{stdout}</div>', unsafe_allow_html=True)
-                    else:
+                        st.code(text, language=None)
+                
+                if cache_results:
+                    success, stdout, stderr = cached(('exec', full_command),
+                                                     lambda: run_command_safe(full_command),
+                                                     ttl=60)
+                    if stdout:
+                        show_output(stdout)
+                else:
+                    success, stdout, stderr = stream_command_safe(full_command, show_output)
+                
+                if success:
+                    if not stdout:
                         st.success("Command executed successfully (no output)")
                     
                     if stderr:
                         st.markdown('<div class="command-header">⚠️ Warnings/Errors:</div>', unsafe_allow_html=True)
-                        st.markdown(f'<div class="error-output">{stderr}</div>', unsafe_allow_html=True)
+                        st.code(stderr, language=None)
                 else:
                     st.error(f"Command failed: {stderr}")
         
@@ -282,9 +829,9 @@ with col2:
         st.markdown("### 📖 Help Information")
         if st.button(f"📚 Get Help for {selected_command}"):
             with st.spinner("Getting help information..."):
-                help_text = get_command_help(selected_command)
+                help_text = get_prefetched_help(selected_command)
                 st.markdown('<div class="command-header">Help Output:</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="command-output">{help_text}</div>', unsafe_allow_html=True)
+                st.code(help_text, language=None)
         
         # Quick actions
         st.markdown("### ⚡ Quick Actions")
@@ -292,21 +839,31 @@ with col2:
         
         with col_a:
             if st.button("📋 List Files", help="Execute: ls -la"):
-                success, stdout, stderr = run_command_safe("ls -la")
+                success, stdout, stderr = run_argv(['ls', '-la'])
                 if success and stdout:
-                    st.markdown('<div class="success-output">' + stdout + '</div>', unsafe_allow_html=True)
+                    st.code(stdout, language=None)
         
         with col_b:
             if st.button("💾 Disk Usage", help="Execute: df -h"):
-                success, stdout, stderr = run_command_safe("df -h")
+                success, stdout, stderr = run_argv(['df', '-h'])
                 if success and stdout:
-                    st.markdown('<div class="success-output">' + stdout + '</div>', unsafe_allow_html=True)
+                    st.code(stdout, language=None)
         
         with col_c:
             if st.button("🔄 Processes", help="Execute: ps aux | head -10"):
-                success, stdout, stderr = run_command_safe("ps aux | head -10")
+                success, stdout, stderr = run_pipeline(['ps', 'aux'], ['head', '-n', '10'])
                 if success and stdout:
-                    st.markdown('<div class="success-output">' + stdout + '</div>', unsafe_allow_html=True)
+                    st.code(stdout, language=None)
+        
+        quick_actions = ["ls -la", "df -h", "ps aux | head -10"]
+        if st.button("⚡ Run All Quick Actions", help="Execute all quick actions in one shell"):
+            success, outputs, stderr = run_commands_batch(quick_actions)
+            if success:
+                for action, stdout in zip(quick_actions, outputs):
+                    st.markdown(f'<div class="command-header">$ {action}</div>', unsafe_allow_html=True)
+                    st.code(stdout, language=None)
+            else:
+                st.error(f"Command failed: {stderr}")
 
 # Footer
 st.markdown("---")
@@ -321,8 +878,8 @@ Some potentially dangerous commands are blocked for security.
 """)
 
 # Statistics
-if len(st.session_state.commands) > 0:
+if len(commands) > 0:
     st.sidebar.markdown("---")
-    st.sidebar.markdown("### 📊 Statistics")
-    st.sidebar.metric("Total Commands", len(st.session_state.commands))
-    st.sidebar.metric("Filtered Commands", len(filtered_commands))
+    with st.sidebar.expander("📊 Statistics", expanded=False):
+        st.metric("Total Commands", len(commands))
+        st.metric("Filtered Commands", len(filtered_commands))
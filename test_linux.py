@@ -0,0 +1,90 @@
+import logging
+import shlex
+import unittest
+
+# Importing the app runs it once in Streamlit's bare mode, which is harmless
+# but logs a warning per UI call
+logging.disable(logging.WARNING)
+import linux  # noqa: E402
+logging.disable(logging.NOTSET)
+
+BLOCKED = [
+    "rm -rf /tmp/x",
+    "/bin/rm x",
+    "mkfs.ext4 /dev/sdb1",
+    "./rm x",
+    "/usr/sbin/mkfs.ext4 /dev/sdb1",
+    "env 'rm' -rf /tmp/x",
+    "env \\rm x",
+    "env r''m x",
+    "env FOO=1 sudo -- rm x",
+    "env -S 'rm -rf /'",
+    "env --split-string='rm x'",
+    "env -S \"'unbalanced\"",
+    "sudo -u root kill 1",
+    "sudo --user root rm x",
+    "sudo -iu root rm x",
+    "xargs -a f 'rm'",
+    "stdbuf -o0 rm x",
+    "setsid rm x",
+    "chroot / rm x",
+    "busybox rm x",
+    "timeout -s KILL 5 kill 1",
+    "find . -exec rm {} ;",
+    "sh -c 'ls; rm x'",
+    "sh -c 'ls\nrm x'",
+    "sh -c 'X=1 rm x'",
+    "sh -c '{ rm x; }'",
+    "sh -c '! rm x'",
+    "sh -c 'exec rm x'",
+    "sh -c 'exec -a name rm x'",
+    "sh -c 'command -p rm x'",
+    "sh -c 'if true; then rm x; fi'",
+    "sh -c 'for f in a; do rm $f; done'",
+    "sh -c 'echo `rm x`'",
+    "sh -c 'echo $(rm x)'",
+    "sh -c 'eval rm x'",
+    "sh -c 'X=rm; $X x'",
+    "bash -lc 'rm x'",
+    "sh -c \"bash -c 'rm x'\"",
+]
+
+ALLOWED = [
+    "ls -la",
+    "ls rm-notes.txt",
+    "cat /tmp/rm",
+    "man rm",
+    "git init",
+    "ddate",
+    "rmate x",
+    "/opt/rm.d/ls",
+    "echo a;rm",
+    "grep kill f",
+    "env FOO=1 ls",
+    "env -S 'ls -la'",
+    "sudo --user root ls",
+    "nice grep -r init /etc",
+    "timeout 5 cat /etc/init",
+    "nohup ls --color=auto /usr/share/dd",
+    "find . -name rm",
+    "sh script.sh",
+    "bash -c 'echo rm'",
+    "sh -c 'X=1 ls; echo done'",
+    "sh -c 'for f in a b; do echo $f; done'",
+]
+
+
+class IsBlockedArgvTest(unittest.TestCase):
+    def test_blocked(self):
+        for command in BLOCKED:
+            with self.subTest(command=command):
+                self.assertTrue(linux.is_blocked_argv(shlex.split(command)))
+
+    def test_allowed(self):
+        for command in ALLOWED:
+            with self.subTest(command=command):
+                self.assertFalse(linux.is_blocked_argv(shlex.split(command)))
+
+
+if __name__ == '__main__':
+    unittest.main()